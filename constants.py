@@ -2,17 +2,24 @@
 Configuration constants for WordSeeker application.
 """
 
+import sys
+
 # --- FILE PATHS ---
 CONFIG_FILE = 'config.json'
 THEMES_FILE = 'themes.json'
 
 # Default theme data
-DEFAULT_THEMES_DATA = {
+_RAW_THEMES_DATA = {
     'Halloween': ['GHOST', 'WITCH', 'PUMPKIN', 'SPOOKY', 'ZOMBIE', 'BAT', 'COSTUME', 'TRICKORTREAT'],
     'Christmas': ['SANTA', 'ELF', 'REINDEER', 'MISTLETOE', 'JINGLEBELLS', 'EGGNOG', 'CANDYCANE', 'STOCKING'],
     'Faith': ['PRAYER', 'GRACE', 'HOPE', 'FAITH', 'LOVE', 'PEACE', 'JOY', 'BIBLE'],
     'Motorsports': ['FORMULAONE', 'NASCAR', 'RALLY', 'DRIFT', 'TURBO', 'PITSTOP', 'CHECKEREDFLAG', 'SPEEDWAY']
 }
+# Read-only word tuples of interned strings, so word comparisons can hit the identity fast path
+DEFAULT_THEMES_DATA = {
+    name: tuple(sys.intern(word) for word in words)
+    for name, words in _RAW_THEMES_DATA.items()
+}
 
 # --- GRID & WORD CONSTRAINTS ---
 MIN_GRID_SIZE = 10
@@ -22,11 +29,10 @@ MAX_WORDS_COUNT = 15
 MIN_WORD_LEN = 2
 MAX_WORD_LEN = 15
 MAX_GENERATION_ATTEMPTS = 50
-MAX_PLACEMENT_ATTEMPTS = 100
 
 # --- WORD PLACEMENT DIRECTIONS ---
-# 8 possible directions: horizontal, vertical, diagonal
-DIRECTIONS = [
+# 8 possible directions: horizontal, vertical, diagonal (read-only lookup)
+DIRECTIONS = (
     (0, 1),   # Right
     (1, 0),   # Down
     (0, -1),  # Left
@@ -35,7 +41,7 @@ DIRECTIONS = [
     (1, -1),  # Down-left
     (-1, 1),  # Up-right
     (-1, -1)  # Up-left
-]
+)
 
 # --- UI CONSTANTS ---
 WINDOW_TITLE = "WordSeeker"
@@ -65,3 +71,4 @@ API_TIMEOUT = 30  # seconds (increased for better reliability)
 
 # --- EXPORT SETTINGS ---
 PDF_SCALE = 0.5
+PNG_GRID_LINE_RGB = (0xCC, 0xCC, 0xCC)  # Pre-parsed '#CCCCCC' for PIL
@@ -3,14 +3,25 @@ Export functions for Word Search Creator.
 Handles PNG and PDF export functionality.
 """
 
+import functools
+
 from PIL import Image, ImageDraw, ImageFont
 from reportlab.pdfgen import canvas as pdf_canvas
 from reportlab.lib.pagesizes import letter
 
-from constants import PNG_CELL_SIZE, CELL_SIZE
+from constants import PNG_CELL_SIZE, CELL_SIZE, PNG_GRID_LINE_RGB
+
+
+@functools.lru_cache(maxsize=8)
+def _get_font(size):
+    """Load the PNG export font once per size, falling back to Pillow's default."""
+    try:
+        return ImageFont.truetype("arial.ttf", size)
+    except OSError:
+        return ImageFont.load_default()
 
 
-def export_grid_to_png(grid, grid_size, bg_color, fg_color, filename):
+def export_grid_to_png(grid, grid_size, bg_color, fg_color, filename, cell_size=PNG_CELL_SIZE):
     """
     Export the grid to a PNG file.
     
@@ -20,44 +31,55 @@ def export_grid_to_png(grid, grid_size, bg_color, fg_color, filename):
         bg_color: QColor for background
         fg_color: QColor for foreground (text)
         filename: Output filename path
+        cell_size: Pixel size of each cell (smaller values suit previews)
     """
-    img_width = grid_size * PNG_CELL_SIZE
-    img_height = grid_size * PNG_CELL_SIZE
+    if cell_size < 1:
+        raise ValueError(f"cell_size must be at least 1 pixel, got {cell_size}")
 
-    # Convert QColor to hex string with '#' for PIL
-    bg_color_hex = bg_color.name()  # Keep the # for PIL
-    fg_color_hex = fg_color.name()  # Keep the # for PIL
+    img_width = grid_size * cell_size
+    img_height = grid_size * cell_size
+
+    # Convert QColor to (r, g, b) tuples so PIL skips color-string parsing
+    bg_rgb = bg_color.getRgb()[:3]
+    fg_rgb = fg_color.getRgb()[:3]
     
-    img = Image.new('RGB', (img_width, img_height), bg_color_hex)
+    img = Image.new('RGB', (img_width, img_height), bg_rgb)
     draw = ImageDraw.Draw(img)
 
-    try:
-        font = ImageFont.truetype("arial.ttf", PNG_CELL_SIZE - 10)
-    except:
-        font = ImageFont.load_default()
-
-    # Draw grid
+    # Letters take 4/5 of the cell (40 for the default 50px cells)
+    font = _get_font(max(1, cell_size * 4 // 5))
+
+    # Rasterize one row of empty cells (top edge plus cell borders) and
+    # paste it down the image; the last lines are clamped to the final
+    # pixel so the right and bottom borders stay visible
+    line_color = PNG_GRID_LINE_RGB
+    row_strip = Image.new('RGB', (img_width, cell_size), bg_rgb)
+    row_strip.paste(line_color, (0, 0, img_width, 1))
+    for i in range(grid_size + 1):
+        offset = min(i * cell_size, img_width - 1)
+        row_strip.paste(line_color, (offset, 0, offset + 1, cell_size))
     for r in range(grid_size):
-        for c in range(grid_size):
-            x = c * PNG_CELL_SIZE
-            y = r * PNG_CELL_SIZE
-
-            # Draw cell background
-            draw.rectangle([x, y, x + PNG_CELL_SIZE, y + PNG_CELL_SIZE],
-                         fill=bg_color_hex,
-                         outline='#cccccc')
-
-            # Draw letter
-            letter = grid[r][c]
+        img.paste(row_strip, (0, r * cell_size))
+    img.paste(line_color, (0, img_height - 1, img_width, img_height))
+
+    # Draw letters, centered on each cell by Pillow (anchor "mm")
+    centers = [i * cell_size + cell_size / 2 for i in range(grid_size)]
+    draw_text = draw.text
+    rows = [''.join(row) for row in grid]
+    for y, row in zip(centers, rows):
+        for x, letter in zip(centers, row):
             if letter != ' ':
-                bbox = draw.textbbox((0, 0), letter, font=font)
-                text_width = bbox[2] - bbox[0]
-                text_height = bbox[3] - bbox[1]
-                text_x = x + (PNG_CELL_SIZE - text_width) // 2
-                text_y = y + (PNG_CELL_SIZE - text_height) // 2
-                draw.text((text_x, text_y), letter, fill=fg_color_hex, font=font)
+                draw_text((x, y), letter, fill=fg_rgb, font=font, anchor="mm")
 
-    img.save(filename)
+    # The grid only uses a handful of colors (plus antialiasing shades), so
+    # an 8-bit palette image carries the same picture in a third of the
+    # bytes; keep RGB if the colors don't fit in a palette
+    colors = img.getcolors(maxcolors=256)
+    if colors is not None:
+        img = img.convert('P', palette=Image.Palette.ADAPTIVE, colors=len(colors))
+
+    # Flat colors compress well even at the fastest zlib level
+    img.save(filename, format='PNG', optimize=False, compress_level=1)
 
 
 def export_grid_to_pdf(grid, grid_size, words, filename):
@@ -85,38 +107,57 @@ def export_grid_to_pdf(grid, grid_size, words, filename):
     offset_x = (width - grid_pixel_width * scale) / 2
     offset_y = (height - grid_pixel_height * scale) / 2
 
+    # Grid is drawn in its own transformed graphics state
+    pdf.saveState()
     pdf.translate(offset_x, offset_y)
     pdf.scale(scale, scale)
 
-    # Draw grid
-    for r in range(grid_size):
-        for col in range(grid_size):
-            x = col * CELL_SIZE
-            y = height - offset_y * 2 - (r + 1) * CELL_SIZE  # Flip Y coordinate for PDF
-
-            # Draw cell
-            pdf.rect(x, y, CELL_SIZE, CELL_SIZE, stroke=1, fill=0)
-
-            # Draw letter
-            letter_char = grid[r][col]
+    # Draw the cell lattice as a single path, stored once as a form
+    # XObject so further pages of the same size can reference it
+    grid_top = height - offset_y * 2  # Flip Y coordinate for PDF
+    xs = [i * CELL_SIZE for i in range(grid_size + 1)]
+    ys = [grid_top - i * CELL_SIZE for i in range(grid_size + 1)]
+    grid_form = f"grid{grid_size}"
+    # Viewers clip forms to their bounding box, so give it the lattice's
+    # extent (padded for the outer strokes)
+    pdf.beginForm(grid_form, xs[0] - 1, ys[-1] - 1, xs[-1] + 1, ys[0] + 1)
+    pdf.grid(xs, ys)
+    pdf.endForm()
+    pdf.doForm(grid_form)
+
+    # Draw letters in one text object (text origin sits 20% into each cell)
+    text = pdf.beginText()
+    text.setFont("Helvetica-Bold", CELL_SIZE * 0.6)
+    text_xs = [x + CELL_SIZE * 0.2 for x in xs[:-1]]
+    text_ys = [y + CELL_SIZE * 0.2 for y in ys[1:]]
+    set_origin = text.setTextOrigin
+    text_out = text.textOut
+    rows = [''.join(row) for row in grid]
+    for y, row in zip(text_ys, rows):
+        for x, letter_char in zip(text_xs, row):
             if letter_char != ' ':
-                pdf.setFont("Helvetica-Bold", CELL_SIZE * 0.6)
-                pdf.drawString(x + CELL_SIZE * 0.2, y + CELL_SIZE * 0.2, letter_char)
+                set_origin(x, y)
+                text_out(letter_char)
+    pdf.drawText(text)
+
+    pdf.restoreState()
 
     # Add words list below the grid
-    pdf.scale(1/scale, 1/scale)  # Reset scale
-    pdf.translate(-offset_x, -offset_y)  # Reset translation
 
     words_y = offset_y - 50
     pdf.setFont("Helvetica-Bold", 14)
     pdf.drawString(offset_x, words_y, "Words to Find:")
     words_y -= 20
 
+    # Lay the words out 10 per line, 80pt apart
     pdf.setFont("Helvetica", 12)
     sorted_words = sorted(words)
-    for i, word in enumerate(sorted_words):
-        if i % 10 == 0 and i > 0:
-            words_y -= 20  # New line every 10 words
-        pdf.drawString(offset_x + (i % 10) * 80, words_y, word)
+    words_per_line, column_width, line_height = 10, 80, 20
+    positions = [
+        (offset_x + (i % words_per_line) * column_width, words_y - (i // words_per_line) * line_height)
+        for i in range(len(sorted_words))
+    ]
+    for (x, y), word in zip(positions, sorted_words):
+        pdf.drawString(x, y, word)
 
     pdf.save()
@@ -3,31 +3,141 @@ WordSeeker - Main Application
 A modern PySide6 application for creating and solving word search puzzles.
 """
 
+import os
 import sys
 import json
+import bisect
+import functools
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QLineEdit, QPushButton, QSpinBox, QComboBox, QTextEdit,
-    QListWidget, QListWidgetItem, QGroupBox, QMessageBox, QFileDialog,
-    QInputDialog, QStatusBar
+    QLabel, QLineEdit, QPushButton, QSpinBox, QComboBox, QPlainTextEdit,
+    QListView, QGroupBox, QMessageBox, QFileDialog,
+    QInputDialog, QStatusBar, QScrollArea, QGridLayout, QSlider, QColorDialog
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer, QStringListModel, QSignalBlocker
 from PySide6.QtGui import QColor, QAction, QPalette, QIcon
 
 # Import from our modules
 from constants import *
 from utils import (
     get_gemini_key, save_gemini_key, load_themes, save_themes,
-    validate_words, ApiWorker
+    load_config, update_config, validate_words, write_json, ApiWorker, PuzzleWorker
 )
-from puzzle_engine import generate_word_search
-from widgets import PuzzleGrid
+from widgets import PuzzleGrid, FoundWordDelegate
+from puzzle_engine import index_grid_lines, read_path_word
 from export import export_grid_to_png, export_grid_to_pdf
 
 
+@functools.lru_cache(maxsize=8)
+def _validate_words_cached(text):
+    """Validate the words box contents, memoized on the raw text (returns a tuple)."""
+    return tuple(validate_words(text.split('\n')))
+
+
+# Stylesheets only depend on constants, so they are built once at import.
+# Window, text and base colors come from the application palette set in
+# apply_dark_mode; the dark sheet only covers what a palette can't express
+# (borders, padding, hover/pressed states).
+_DARK_QSS = f"""
+QGroupBox {{
+    background-color: #353535;
+    border: 2px solid #505050;
+    border-radius: 8px;
+    margin-top: 10px;
+    padding-top: 15px;
+    font-weight: bold;
+}}
+QGroupBox::title {{
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}}
+QPushButton {{
+    background-color: {DARK_BUTTON_BG};
+    border: 1px solid #555;
+    border-radius: 5px;
+    padding: 8px;
+    font-size: 13px;
+}}
+QPushButton:hover {{
+    background-color: #4A4A4A;
+    border: 1px solid #666;
+}}
+QPushButton:pressed {{
+    background-color: #2A2A2A;
+}}
+QLineEdit, QPlainTextEdit, QSpinBox, QComboBox {{
+    background-color: #353535;
+    border: 1px solid #555;
+    border-radius: 4px;
+    padding: 5px;
+}}
+QListView {{
+    border: 1px solid #555;
+    border-radius: 4px;
+}}
+QMenuBar::item:selected, QMenu::item:selected {{
+    background-color: #4A4A4A;
+}}
+QMenu {{
+    border: 1px solid #555;
+}}
+"""
+
+_LIGHT_QSS = f"""
+QGroupBox {{
+    background-color: white;
+    border: 2px solid {ACCENT_COLOR};
+    border-radius: 8px;
+    margin-top: 10px;
+    padding-top: 15px;
+    font-weight: bold;
+}}
+QGroupBox::title {{
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}}
+QPushButton {{
+    background-color: {ACCENT_COLOR};
+    color: white;
+    border: none;
+    border-radius: 5px;
+    padding: 8px;
+    font-size: 13px;
+}}
+QPushButton:hover {{
+    background-color: #0056B3;
+}}
+QPushButton:pressed {{
+    background-color: #004085;
+}}
+QLineEdit, QPlainTextEdit, QSpinBox, QComboBox {{
+    border: 1px solid #CED4DA;
+    border-radius: 4px;
+    padding: 5px;
+    background-color: white;
+}}
+QLineEdit:focus, QPlainTextEdit:focus, QSpinBox:focus, QComboBox:focus {{
+    border: 2px solid {ACCENT_COLOR};
+}}
+QListView {{
+    border: 1px solid #CED4DA;
+    border-radius: 4px;
+    background-color: white;
+}}
+"""
+
+
 class WordSearchApp(QMainWindow):
     """Main application window for Word Search Creator."""
 
+    # Grid (background, text, found) colors per dark mode setting, parsed once
+    _GRID_COLORS = {
+        True: (QColor(DARK_BG_COLOR), QColor(DARK_FG_COLOR), QColor(DARK_FOUND_COLOR)),
+        False: (QColor(DEFAULT_BG_COLOR), QColor(DEFAULT_FG_COLOR), QColor(FOUND_COLOR)),
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(WINDOW_TITLE)
@@ -42,13 +152,17 @@ class WordSearchApp(QMainWindow):
         # Puzzle Data
         self.grid_size = 15
         self.grid = None
-        self.words = set()
+        self.words = frozenset()  # Immutable; replaced wholesale when the puzzle changes
+        self._sorted_words = []  # sorted(self.words), kept in step with self.words
+        self.words_rev = {}  # Reversed spelling -> word, for backwards selections
+        self.grid_lines = {}  # Row/column/diagonal strings from index_grid_lines
         self.placed_words = []
         self.unfound_words = set()
 
         # Solver State
         self.found_words = set()
         self.found_paths = set()
+        self.found_cells = set()  # Union of the cells in found_paths
         self.hint_paths = set()
         self.selected_word = None
 
@@ -56,19 +170,33 @@ class WordSearchApp(QMainWindow):
         self.bg_color = QColor(DEFAULT_BG_COLOR)
         self.fg_color = QColor(DEFAULT_FG_COLOR)
         self.current_theme_name = ""
-        self.word_themes = load_themes()
+        self.word_themes = None  # Loaded after the window is shown, see _ensure_themes_loaded
+        self._theme_names = []  # Mirrors the combo box (minus the blank entry)
+        self._theme_names_set = set()
         self.unsaved_changes = False
+        self._flush_pending = False
+        self._ui_update_pending = False
+        self._applied_mode = None  # Dark mode value of the current stylesheet
+        self._dark_palette = None  # Application palettes, built on first use
+        self._light_palette = None
         self.dark_mode = self.load_dark_mode_preference()
 
         # UI Components
         self.api_worker = None
+        self.puzzle_worker = None
         self.puzzle_grid = None
         self.words_list = None
         self.status_bar = None
         self.dark_mode_button = None
 
+        # The stylesheet leaves colors to the palette, so a saved dark palette
+        # must be installed before setup_ui() polishes the widgets
+        if self.dark_mode:
+            self._install_palette()
+
         self.setup_ui()
-        self.setup_menu()
+        # The menu bar isn't needed for the first paint, so build it once the event loop runs
+        QTimer.singleShot(0, self.setup_menu)
         self.check_api_key_status()
         
         # Apply dark mode if it was saved
@@ -102,7 +230,6 @@ class WordSearchApp(QMainWindow):
     def setup_control_panel(self, parent_layout):
         """Set up the left control panel."""
         # Create scroll area for controls
-        from PySide6.QtWidgets import QScrollArea
         scroll_area = QScrollArea()
         scroll_area.setWidgetResizable(True)
         scroll_area.setFixedWidth(420)
@@ -152,7 +279,6 @@ class WordSearchApp(QMainWindow):
 
     def setup_topic_section(self, parent_layout):
         """Set up topic-based word generation section."""
-        from PySide6.QtWidgets import QGridLayout
         topic_group = QGroupBox("💬 Generate from Topic")
         topic_layout = QGridLayout(topic_group)
 
@@ -184,8 +310,8 @@ class WordSearchApp(QMainWindow):
         self.theme_combo = QComboBox()
         # Add blank option at top for creating new themes
         self.theme_combo.addItem("")
-        for theme_name in sorted(self.word_themes.keys()):
-            self.theme_combo.addItem(theme_name)
+        # Theme names are filled in once the event loop is running
+        QTimer.singleShot(0, self._ensure_themes_loaded)
 
         theme_layout.addWidget(self.theme_combo)
 
@@ -220,7 +346,7 @@ class WordSearchApp(QMainWindow):
         words_group = QGroupBox("📝 Custom Words (One per line)")
         words_layout = QVBoxLayout(words_group)
 
-        self.words_text = QTextEdit()
+        self.words_text = QPlainTextEdit()
         self.words_text.setPlaceholderText("Enter words here...\nOne word per line")
         self.words_text.setMinimumHeight(200)  # Make it taller
         # Start with empty words list (no theme selected)
@@ -237,7 +363,6 @@ class WordSearchApp(QMainWindow):
         size_layout.addWidget(self.size_label)
         
         # Slider for grid size
-        from PySide6.QtWidgets import QSlider
         self.size_slider = QSlider(Qt.Vertical)
         self.size_slider.setRange(MIN_GRID_SIZE, MAX_GRID_SIZE)
         self.size_slider.setValue(15)
@@ -261,13 +386,16 @@ class WordSearchApp(QMainWindow):
     
     def on_size_changed(self, value):
         """Handle slider value change."""
-        self.size_spin.setValue(value)
+        # Block the spin box's valueChanged so it doesn't bounce back into on_size_spin_changed
+        with QSignalBlocker(self.size_spin):
+            self.size_spin.setValue(value)
         self.size_label.setText(f"Size: {value}x{value}")
         self.grid_size = value
     
     def on_size_spin_changed(self, value):
         """Handle spin box value change."""
-        self.size_slider.setValue(value)
+        with QSignalBlocker(self.size_slider):
+            self.size_slider.setValue(value)
         self.size_label.setText(f"Size: {value}x{value}")
         self.grid_size = value
 
@@ -349,11 +477,20 @@ class WordSearchApp(QMainWindow):
         self.puzzle_grid.word_selected.connect(self.on_word_selected)
         self.puzzle_grid.puzzle_clicked.connect(self.on_puzzle_clicked)
 
-        # Word lists container (will be populated dynamically)
-        self.words_list_container = QWidget()
-        self.words_list_layout = QHBoxLayout(self.words_list_container)
-        self.words_list_layout.setSpacing(10)
-        self.words_list_layout.setContentsMargins(0, 0, 0, 0)
+        # Word list: one persistent view over a string model, with words
+        # flowing top-to-bottom and wrapping into columns
+        self.words_model = QStringListModel()
+        self.words_view = QListView()
+        self.words_view.setModel(self.words_model)
+        self.words_view.setFlow(QListView.TopToBottom)
+        self.words_view.setWrapping(True)
+        self.words_view.setResizeMode(QListView.Adjust)
+        self.words_view.setSpacing(2)
+        self.words_view.setEditTriggers(QListView.NoEditTriggers)
+        self.words_view.setMaximumHeight(200)
+        self.words_delegate = FoundWordDelegate(self.words_view)
+        self.words_view.setItemDelegate(self.words_delegate)
+        self.words_view.clicked.connect(self.on_word_clicked)
 
         # Buttons on the right side
         buttons_layout = QHBoxLayout()
@@ -371,43 +508,19 @@ class WordSearchApp(QMainWindow):
         buttons_layout.addWidget(clear_hints_btn)
 
         display_layout.addWidget(self.puzzle_grid, 3)
-        display_layout.addWidget(self.words_list_container, 1)
+        display_layout.addWidget(self.words_view, 1)
         display_layout.addLayout(buttons_layout)
 
         parent_layout.addWidget(display_panel, 1)
 
     def create_word_lists(self):
-        """Create word list widgets dynamically with max 10 words per column."""
-        # Clear existing word lists
-        while self.words_list_layout.count():
-            child = self.words_list_layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-        if not self.words:
-            return
-
-        # Calculate words per column (max 10)
-        max_words_per_column = 10
-        num_columns = (len(self.words) + max_words_per_column - 1) // max_words_per_column
-
-        sorted_words = sorted(self.words)
-        for col_idx in range(num_columns):
-            word_list = QListWidget()
-            word_list.setMaximumHeight(200)
-
-            # Add words for this column
-            start_idx = col_idx * max_words_per_column
-            end_idx = min(start_idx + max_words_per_column, len(sorted_words))
-
-            for word in sorted_words[start_idx:end_idx]:
-                item = QListWidgetItem(word)
-                if word in self.found_words:
-                    item.setForeground(QColor(SUCCESS_COLOR))
-                word_list.addItem(item)
-
-            word_list.itemClicked.connect(self.on_word_clicked)
-            self.words_list_layout.addWidget(word_list)
+        """Fill the word list with the sorted words; found words are colored by the delegate."""
+        self.words_delegate.found_words = self.found_words
+        if self.words_model.stringList() != self._sorted_words:
+            self.words_model.setStringList(self._sorted_words)
+        else:
+            # Same words, only found-word colors changed: repaint without a model reset
+            self.words_view.viewport().update()
 
     def setup_menu(self):
         """Set up the application menu bar."""
@@ -419,28 +532,26 @@ class WordSearchApp(QMainWindow):
         save_action = QAction("Save Puzzle", self)
         save_action.setShortcut("Ctrl+S")
         save_action.triggered.connect(self.save_puzzle)
-        file_menu.addAction(save_action)
 
         load_action = QAction("Load Puzzle", self)
         load_action.setShortcut("Ctrl+O")
         load_action.triggered.connect(self.load_puzzle)
-        file_menu.addAction(load_action)
-
-        file_menu.addSeparator()
 
         export_png_action = QAction("Export PNG", self)
         export_png_action.triggered.connect(self.export_png)
-        file_menu.addAction(export_png_action)
 
         export_pdf_action = QAction("Export PDF", self)
         export_pdf_action.triggered.connect(self.export_pdf)
-        file_menu.addAction(export_pdf_action)
-
-        file_menu.addSeparator()
 
         exit_action = QAction("Exit", self)
         exit_action.setShortcut("Ctrl+Q")
         exit_action.triggered.connect(self.close)
+
+        # Add each group in one call; separators go between the groups
+        file_menu.addActions([save_action, load_action])
+        file_menu.addSeparator()
+        file_menu.addActions([export_png_action, export_pdf_action])
+        file_menu.addSeparator()
         file_menu.addAction(exit_action)
 
         # Help menu
@@ -452,127 +563,10 @@ class WordSearchApp(QMainWindow):
 
     def apply_modern_styling(self):
         """Apply modern styling to the application."""
-        if self.dark_mode:
-            # Dark mode stylesheet
-            self.setStyleSheet(f"""
-            QMainWindow {{
-                background-color: {DARK_BG_COLOR};
-            }}
-            QWidget {{
-                background-color: {DARK_BG_COLOR};
-                color: {DARK_FG_COLOR};
-            }}
-            QLabel {{
-                background-color: transparent;
-                color: {DARK_FG_COLOR};
-            }}
-            QGroupBox {{
-                background-color: #353535;
-                border: 2px solid #505050;
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-                font-weight: bold;
-                color: {DARK_FG_COLOR};
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }}
-            QPushButton {{
-                background-color: {DARK_BUTTON_BG};
-                color: {DARK_BUTTON_FG};
-                border: 1px solid #555;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: #4A4A4A;
-                border: 1px solid #666;
-            }}
-            QPushButton:pressed {{
-                background-color: #2A2A2A;
-            }}
-            QLineEdit, QTextEdit, QSpinBox, QComboBox {{
-                background-color: #353535;
-                color: {DARK_FG_COLOR};
-                border: 1px solid #555;
-                border-radius: 4px;
-                padding: 5px;
-            }}
-            QListWidget {{
-                background-color: #353535;
-                color: {DARK_FG_COLOR};
-                border: 1px solid #555;
-                border-radius: 4px;
-            }}
-            QStatusBar {{
-                background-color: #353535;
-                color: {DARK_FG_COLOR};
-            }}
-            QMenuBar {{
-                background-color: #353535;
-                color: {DARK_FG_COLOR};
-            }}
-            QMenuBar::item:selected {{
-                background-color: #4A4A4A;
-            }}
-            QMenu {{
-                background-color: #353535;
-                color: {DARK_FG_COLOR};
-                border: 1px solid #555;
-            }}
-            QMenu::item:selected {{
-                background-color: #4A4A4A;
-            }}
-            """)
-        else:
-            # Light mode stylesheet
-            self.setStyleSheet(f"""
-            QGroupBox {{
-                background-color: white;
-                border: 2px solid {ACCENT_COLOR};
-                border-radius: 8px;
-                margin-top: 10px;
-                padding-top: 15px;
-                font-weight: bold;
-            }}
-            QGroupBox::title {{
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }}
-            QPushButton {{
-                background-color: {ACCENT_COLOR};
-                color: white;
-                border: none;
-                border-radius: 5px;
-                padding: 8px;
-                font-size: 13px;
-            }}
-            QPushButton:hover {{
-                background-color: #0056B3;
-            }}
-            QPushButton:pressed {{
-                background-color: #004085;
-            }}
-            QLineEdit, QTextEdit, QSpinBox, QComboBox {{
-                border: 1px solid #CED4DA;
-                border-radius: 4px;
-                padding: 5px;
-                background-color: white;
-            }}
-            QLineEdit:focus, QTextEdit:focus, QSpinBox:focus, QComboBox:focus {{
-                border: 2px solid {ACCENT_COLOR};
-            }}
-            QListWidget {{
-                border: 1px solid #CED4DA;
-                border-radius: 4px;
-                background-color: white;
-            }}
-            """)
+        if self._applied_mode == self.dark_mode:
+            return  # Re-setting the same stylesheet would re-polish every widget
+        self.setStyleSheet(_DARK_QSS if self.dark_mode else _LIGHT_QSS)
+        self._applied_mode = self.dark_mode
 
     def check_api_key_status(self):
         """Check if API key is configured and update UI."""
@@ -580,29 +574,25 @@ class WordSearchApp(QMainWindow):
 
     def load_dark_mode_preference(self):
         """Load dark mode preference from config.json."""
-        import os
-        try:
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    return config.get('dark_mode', False)
-        except (FileNotFoundError, json.JSONDecodeError):
-            pass
-        return False
+        return load_config().get('dark_mode', False)
 
     def save_dark_mode_preference(self):
         """Save dark mode preference to config.json."""
-        import os
+        self._schedule_config_flush()
+
+    def _schedule_config_flush(self):
+        """Write the config shortly, so rapid toggles coalesce into one write."""
+        if not self._flush_pending:
+            self._flush_pending = True
+            QTimer.singleShot(200, self._flush_config)
+
+    def _flush_config(self):
+        """Write the current dark mode preference to config.json."""
+        if not self._flush_pending:
+            return
+        self._flush_pending = False
         try:
-            config = {}
-            if os.path.exists(CONFIG_FILE):
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-            
-            config['dark_mode'] = self.dark_mode
-            
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=4)
+            update_config({'dark_mode': self.dark_mode})
         except Exception as e:
             print(f"Warning: Could not save dark mode preference: {e}")
 
@@ -644,12 +634,20 @@ class WordSearchApp(QMainWindow):
         self.api_worker.error.connect(self.on_fetch_error)
         self.api_worker.start()
 
+    def set_words_text(self, words):
+        """Replace the custom words box with one word per line in a single layout pass."""
+        self.words_text.setUpdatesEnabled(False)
+        try:
+            self.words_text.setPlainText('\n'.join(words))
+        finally:
+            self.words_text.setUpdatesEnabled(True)
+
     def on_words_fetched(self, words, topic):
         """Handle successful word fetch from API."""
         self.set_controls_enabled(True)
 
         if words:
-            self.words_text.setPlainText('\n'.join(words))
+            self.set_words_text(words)
             self.status_bar.showMessage(f"✓ Fetched {len(words)} words for topic: {topic}")
             QMessageBox.information(self, "Success", f"Fetched {len(words)} words for '{topic}'!")
         else:
@@ -663,26 +661,37 @@ class WordSearchApp(QMainWindow):
         QMessageBox.critical(self, "API Error", f"Failed to fetch words:\n{error_msg}")
 
     def set_controls_enabled(self, enabled):
-        """Enable or disable controls during API calls."""
+        """Enable or disable controls during API calls and puzzle generation."""
         self.fetch_btn.setEnabled(enabled)
         self.generate_btn.setEnabled(enabled)
         self.topic_input.setEnabled(enabled)
         self.num_words_spin.setEnabled(enabled)
 
+    def _ensure_themes_loaded(self):
+        """Load themes.json and fill the theme combo box on first use."""
+        if self.word_themes is None:
+            self.word_themes = load_themes()
+            self._theme_names = sorted(self.word_themes)
+            self._theme_names_set = set(self._theme_names)
+            self.theme_combo.addItems(self._theme_names)
+        return self.word_themes
+
     def load_theme(self):
         """Load a theme from the dropdown."""
+        self._ensure_themes_loaded()
         theme_name = self.theme_combo.currentText()
         if not theme_name:  # Blank selection
             return
 
         if theme_name in self.word_themes:
             words = self.word_themes[theme_name]
-            self.words_text.setPlainText('\n'.join(words))
+            self.set_words_text(words)
             self.current_theme_name = theme_name
             self.status_bar.showMessage(f"✓ Loaded theme: {theme_name}")
 
     def save_as_theme(self):
         """Save current words as a theme."""
+        self._ensure_themes_loaded()
         words_text = self.words_text.toPlainText().strip()
         if not words_text:
             QMessageBox.warning(self, "No Words", "Please enter some words first.")
@@ -717,8 +726,7 @@ class WordSearchApp(QMainWindow):
             theme_name = theme_name.strip()
 
         # Save the theme
-        words_list = words_text.split('\n')
-        validated = validate_words(words_list)
+        validated = list(_validate_words_cached(words_text))
 
         if not validated:
             QMessageBox.warning(self, "Invalid Words", "No valid words to save.")
@@ -727,9 +735,12 @@ class WordSearchApp(QMainWindow):
         self.word_themes[theme_name] = validated
         save_themes(self.word_themes)
 
-        # Update combo box if needed
-        if theme_name not in [self.theme_combo.itemText(i) for i in range(self.theme_combo.count())]:
-            self.theme_combo.addItem(theme_name)
+        # Update combo box if needed, keeping it sorted
+        if theme_name not in self._theme_names_set:
+            position = bisect.bisect(self._theme_names, theme_name)
+            self._theme_names.insert(position, theme_name)
+            self._theme_names_set.add(theme_name)
+            self.theme_combo.insertItem(position + 1, theme_name)  # +1 skips the blank entry
 
         # Select the saved theme
         self.theme_combo.setCurrentText(theme_name)
@@ -740,6 +751,7 @@ class WordSearchApp(QMainWindow):
 
     def delete_theme(self):
         """Delete the selected theme."""
+        self._ensure_themes_loaded()
         theme_name = self.theme_combo.currentText()
         if not theme_name:
             QMessageBox.warning(self, "No Theme", "Please select a theme to delete.")
@@ -762,6 +774,9 @@ class WordSearchApp(QMainWindow):
             index = self.theme_combo.findText(theme_name)
             if index >= 0:
                 self.theme_combo.removeItem(index)
+            if theme_name in self._theme_names_set:
+                self._theme_names_set.discard(theme_name)
+                self._theme_names.remove(theme_name)
 
             # Clear selection
             self.theme_combo.setCurrentIndex(0)  # Select blank
@@ -777,8 +792,7 @@ class WordSearchApp(QMainWindow):
             QMessageBox.warning(self, "No Words", "Please enter some words first.")
             return
 
-        words_list = words_text.split('\n')
-        validated_words = validate_words(words_list)
+        validated_words = list(_validate_words_cached(words_text))
 
         if not validated_words:
             QMessageBox.warning(self, "Invalid Words", "No valid words found. Words must be 2-15 uppercase letters.")
@@ -790,9 +804,24 @@ class WordSearchApp(QMainWindow):
         self.set_controls_enabled(False)
         self.status_bar.showMessage("🔄 Generating puzzle...")
 
-        # Generate puzzle (this might take a moment for large grids)
-        grid, placed_words = generate_word_search(self.grid_size, validated_words)
-
+        # Generate puzzle in a worker thread (this might take a moment for large grids).
+        # Parented to the window so it outlives a discarded reference.
+        self.puzzle_worker = PuzzleWorker(self.grid_size, validated_words, self)
+        self.puzzle_worker.finished.connect(self.on_puzzle_generated)
+        self.puzzle_worker.error.connect(self.on_generation_error)
+        self.puzzle_worker.start()
+
+    def _set_words(self, words):
+        """Replace the puzzle's word set along with its sorted and reversed views."""
+        self.words = frozenset(words)
+        self._sorted_words = sorted(self.words)
+        self.words_rev = {w[::-1]: w for w in self.words}
+
+    def on_puzzle_generated(self, grid, placed_words, validated_words):
+        """Handle a finished puzzle from the generation worker thread."""
+        if self.sender() is not self.puzzle_worker:
+            return  # superseded by a load or clear while generating
+        self.puzzle_worker = None
         self.set_controls_enabled(True)
 
         if grid is None:
@@ -802,66 +831,101 @@ class WordSearchApp(QMainWindow):
 
         # Update state
         self.grid = grid
-        self.words = set(validated_words)
+        self.grid_lines = index_grid_lines(grid)
+        self._set_words(validated_words)
         self.placed_words = placed_words
-        self.unfound_words = set(validated_words)
+        self.unfound_words = set(self.words)
         self.found_words = set()
         self.found_paths = set()
+        self.found_cells = set()
         self.hint_paths = set()
 
         # Update UI
-        self.puzzle_grid.set_grid(grid)
-        self.update_words_list()
+        self.refresh_puzzle_display()
 
         self.status_bar.showMessage(f"✓ Puzzle generated! Find {len(validated_words)} words.")
         self.unsaved_changes = True
 
+    def on_generation_error(self, error_msg):
+        """Handle error from the generation worker thread."""
+        if self.sender() is not self.puzzle_worker:
+            return
+        self.puzzle_worker = None
+        self.set_controls_enabled(True)
+        self.status_bar.showMessage("❌ Puzzle generation failed.")
+        QMessageBox.critical(self, "Generation Failed", f"Could not generate the puzzle:\n{error_msg}")
+
+    def _discard_puzzle_worker(self):
+        """Drop a running generation so its result can't overwrite the current puzzle."""
+        if self.puzzle_worker is not None:
+            self.puzzle_worker = None
+            self.set_controls_enabled(True)
+
     # Alias for backward compatibility
     def generate_puzzle(self):
         """Alias for generate()."""
         self.generate()
 
+    def refresh_puzzle_display(self):
+        """Reload the grid and word list, coalescing them into one paint pass."""
+        self.setUpdatesEnabled(False)
+        try:
+            self.puzzle_grid.set_grid(self.grid)
+            self.update_words_list()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _schedule_ui_update(self):
+        """Refresh the word list on the next event-loop pass, coalescing repeated requests."""
+        if not self._ui_update_pending:
+            self._ui_update_pending = True
+            QTimer.singleShot(0, self._flush_ui_update)
+
+    def _flush_ui_update(self):
+        """Run a word list refresh requested through _schedule_ui_update."""
+        if not self._ui_update_pending:
+            return
+        self._ui_update_pending = False
+        self.update_words_list()
+
     def update_words_list(self):
         """Update the word list display."""
         self.create_word_lists()
 
     def on_word_selected(self, path):
         """Handle word selection on the grid."""
-        # Extract word from the path
-        word = ''.join([self.grid[r][c] for r, c in path])
+        # Extract word from the path, slicing the pre-joined grid line when possible
+        word = read_path_word(self.grid_lines, path)
+        if word is None:
+            word = ''.join([self.grid[r][c] for r, c in path])
 
-        # Check if it matches any word (forward or backward)
+        # Check if it matches any word (forward, then backward via words_rev)
         if word in self.words and word not in self.found_words:
-            self.found_words.add(word)
-            self.found_paths.add(frozenset(path))
-            self.unfound_words.discard(word)
-            self.update_words_list()
-            self.puzzle_grid.set_grid(self.grid, self.found_paths, self.hint_paths)
-            self.status_bar.showMessage(f"✓ Found: {word}! ({len(self.found_words)}/{len(self.words)})")
-
-            # Check if all words found
-            if not self.unfound_words:
-                QMessageBox.information(self, "🎉 Congratulations!", "You found all the words!")
-                self.status_bar.showMessage("🎉 Puzzle completed!")
+            hit = word
         else:
-            # Check reverse
-            word_rev = word[::-1]
-            if word_rev in self.words and word_rev not in self.found_words:
-                self.found_words.add(word_rev)
-                self.found_paths.add(frozenset(path))
-                self.unfound_words.discard(word_rev)
-                self.update_words_list()
-                self.puzzle_grid.set_grid(self.grid, self.found_paths, self.hint_paths)
-                self.status_bar.showMessage(f"✓ Found: {word_rev}! ({len(self.found_words)}/{len(self.words)})")
-
-                # Check if all words found
-                if not self.unfound_words:
-                    QMessageBox.information(self, "🎉 Congratulations!", "You found all the words!")
-                    self.status_bar.showMessage("🎉 Puzzle completed!")
-
-    def on_word_clicked(self, item):
+            hit = self.words_rev.get(word)
+        if hit is not None and hit not in self.found_words:
+            self._register_found(hit, path)
+
+    def _register_found(self, word, path):
+        """Record a found word and update the list, grid and status bar."""
+        self.found_words.add(word)
+        self.found_paths.add(tuple(path))
+        self.found_cells.update(path)
+        self.unfound_words.discard(word)
+        self._schedule_ui_update()
+        self.puzzle_grid.mark_path_found(path)
+        self.status_bar.showMessage(f"✓ Found: {word}! ({len(self.found_words)}/{len(self.words)})")
+
+        # Check if all words found
+        if not self.unfound_words:
+            QMessageBox.information(self, "🎉 Congratulations!", "You found all the words!")
+            self.status_bar.showMessage("🎉 Puzzle completed!")
+
+    def on_word_clicked(self, index):
         """Handle word clicked in the list."""
-        word = item.text()
+        word = index.data()
         if word in self.unfound_words:
             self.selected_word = word
             self.status_bar.showMessage(f"Selected: {word} - Click 'Hint' to reveal first letter")
@@ -890,9 +954,9 @@ class WordSearchApp(QMainWindow):
                 if path and isinstance(path[0], list):
                     path = [tuple(cell) for cell in path]
                 # Highlight only the first letter
-                first_cell_path = frozenset([path[0]])
+                first_cell_path = (path[0],)
                 self.hint_paths = {first_cell_path}
-                self.puzzle_grid.set_grid(self.grid, self.found_paths, self.hint_paths)
+                self.puzzle_grid.set_hint_paths(self.hint_paths)
                 self.status_bar.showMessage(f"💡 Hint: First letter of '{self.selected_word}' highlighted")
                 return
 
@@ -901,7 +965,7 @@ class WordSearchApp(QMainWindow):
     def clear_hints(self):
         """Clear all hint highlighting."""
         self.hint_paths = set()
-        self.puzzle_grid.set_grid(self.grid, self.found_paths, self.hint_paths)
+        self.puzzle_grid.set_hint_paths(self.hint_paths)
 
     def on_puzzle_clicked(self):
         """Handle puzzle grid clicked - clear hints and selection."""
@@ -916,40 +980,13 @@ class WordSearchApp(QMainWindow):
 
     def apply_dark_mode(self):
         """Apply dark or light mode based on current setting."""
-        # Apply dark mode palette to entire application
-        app = QApplication.instance()
-        if self.dark_mode:
-            # Create dark palette
-            dark_palette = QPalette()
-            dark_palette.setColor(QPalette.Window, QColor(DARK_BG_COLOR))
-            dark_palette.setColor(QPalette.WindowText, QColor(DARK_FG_COLOR))
-            dark_palette.setColor(QPalette.Base, QColor("#353535"))
-            dark_palette.setColor(QPalette.AlternateBase, QColor(DARK_BG_COLOR))
-            dark_palette.setColor(QPalette.ToolTipBase, QColor(DARK_FG_COLOR))
-            dark_palette.setColor(QPalette.ToolTipText, QColor(DARK_FG_COLOR))
-            dark_palette.setColor(QPalette.Text, QColor(DARK_FG_COLOR))
-            dark_palette.setColor(QPalette.Button, QColor(DARK_BUTTON_BG))
-            dark_palette.setColor(QPalette.ButtonText, QColor(DARK_BUTTON_FG))
-            dark_palette.setColor(QPalette.BrightText, QColor("#FF0000"))
-            dark_palette.setColor(QPalette.Link, QColor("#2A82DA"))
-            dark_palette.setColor(QPalette.Highlight, QColor("#2A82DA"))
-            dark_palette.setColor(QPalette.HighlightedText, QColor("#000000"))
-            app.setPalette(dark_palette)
-
-            # Update grid colors
-            if self.puzzle_grid:
-                self.puzzle_grid.bg_color = QColor(DARK_BG_COLOR)
-                self.puzzle_grid.fg_color = QColor(DARK_FG_COLOR)
-                self.puzzle_grid.found_color = QColor(DARK_FOUND_COLOR)
-        else:
-            # Reset to default light palette
-            app.setPalette(app.style().standardPalette())
+        self._install_palette()
 
-            # Update grid colors
-            if self.puzzle_grid:
-                self.puzzle_grid.bg_color = QColor(DEFAULT_BG_COLOR)
-                self.puzzle_grid.fg_color = QColor(DEFAULT_FG_COLOR)
-                self.puzzle_grid.found_color = QColor(FOUND_COLOR)
+        # Update grid colors
+        if self.puzzle_grid:
+            (self.puzzle_grid.bg_color,
+             self.puzzle_grid.fg_color,
+             self.puzzle_grid.found_color) = self._GRID_COLORS[self.dark_mode]
 
         # Reapply styling
         self.apply_modern_styling()
@@ -961,24 +998,51 @@ class WordSearchApp(QMainWindow):
         if hasattr(self, 'status_bar') and self.status_bar:
             self.status_bar.showMessage(f"{'🌙 Dark' if self.dark_mode else '☀️ Light'} mode enabled")
 
+    def _install_palette(self):
+        """Set the application palette for the current mode."""
+        # Apply dark mode palette to entire application
+        app = QApplication.instance()
+        if self.dark_mode:
+            if self._dark_palette is None:
+                # Create dark palette
+                dark_palette = QPalette()
+                dark_palette.setColor(QPalette.Window, QColor(DARK_BG_COLOR))
+                dark_palette.setColor(QPalette.WindowText, QColor(DARK_FG_COLOR))
+                dark_palette.setColor(QPalette.Base, QColor("#353535"))
+                dark_palette.setColor(QPalette.AlternateBase, QColor(DARK_BG_COLOR))
+                dark_palette.setColor(QPalette.ToolTipBase, QColor(DARK_FG_COLOR))
+                dark_palette.setColor(QPalette.ToolTipText, QColor(DARK_FG_COLOR))
+                dark_palette.setColor(QPalette.Text, QColor(DARK_FG_COLOR))
+                dark_palette.setColor(QPalette.Button, QColor(DARK_BUTTON_BG))
+                dark_palette.setColor(QPalette.ButtonText, QColor(DARK_BUTTON_FG))
+                dark_palette.setColor(QPalette.BrightText, QColor("#FF0000"))
+                dark_palette.setColor(QPalette.Link, QColor("#2A82DA"))
+                dark_palette.setColor(QPalette.Highlight, QColor("#2A82DA"))
+                dark_palette.setColor(QPalette.HighlightedText, QColor("#000000"))
+                self._dark_palette = dark_palette
+            app.setPalette(self._dark_palette)
+        else:
+            # Reset to default light palette
+            if self._light_palette is None:
+                self._light_palette = app.style().standardPalette()
+            app.setPalette(self._light_palette)
+
     def choose_bg_color(self):
         """Choose background color."""
-        from PySide6.QtWidgets import QColorDialog
         color = QColorDialog.getColor(self.bg_color, self, "Choose Background Color")
         if color.isValid():
             self.bg_color = color
             if self.grid:
-                self.puzzle_grid.set_grid(self.grid, self.found_paths, self.hint_paths)
+                self.puzzle_grid.set_grid(self.grid, self.found_paths, self.hint_paths, self.found_cells)
             self.unsaved_changes = True
 
     def choose_text_color(self):
         """Choose text color."""
-        from PySide6.QtWidgets import QColorDialog
         color = QColorDialog.getColor(self.fg_color, self, "Choose Text Color")
         if color.isValid():
             self.fg_color = color
             if self.grid:
-                self.puzzle_grid.set_grid(self.grid, self.found_paths, self.hint_paths)
+                self.puzzle_grid.set_grid(self.grid, self.found_paths, self.hint_paths, self.found_cells)
             self.unsaved_changes = True
 
     def save_puzzle(self):
@@ -988,7 +1052,6 @@ class WordSearchApp(QMainWindow):
             return
 
         # Create saved/ folder if it doesn't exist
-        import os
         saved_dir = os.path.join(os.path.dirname(__file__), 'saved')
         os.makedirs(saved_dir, exist_ok=True)
 
@@ -1012,8 +1075,7 @@ class WordSearchApp(QMainWindow):
                     'grid_size': self.grid_size
                 }
 
-                with open(filename, 'w') as f:
-                    json.dump(puzzle_data, f, indent=4)
+                write_json(filename, puzzle_data, indent=True)
 
                 QMessageBox.information(self, "Success", "Puzzle saved successfully!")
                 self.status_bar.showMessage(f"✓ Puzzle saved to {filename}")
@@ -1024,7 +1086,6 @@ class WordSearchApp(QMainWindow):
     def load_puzzle(self):
         """Load a puzzle from a JSON file."""
         # Create saved/ folder if it doesn't exist
-        import os
         saved_dir = os.path.join(os.path.dirname(__file__), 'saved')
         os.makedirs(saved_dir, exist_ok=True)
 
@@ -1037,34 +1098,37 @@ class WordSearchApp(QMainWindow):
 
         if filename:
             try:
-                with open(filename, 'r') as f:
+                with open(filename, 'rb') as f:
                     puzzle_data = json.load(f)
 
                 self.grid = puzzle_data['grid']
-                self.words = set(puzzle_data['words'])
+                self.grid_lines = index_grid_lines(self.grid)
+                self._set_words(puzzle_data['words'])
                 self.placed_words = puzzle_data['placed_words']
                 
-                # Convert paths from lists to tuples (JSON stores tuples as lists)
-                for word_data in self.placed_words:
-                    if 'path' in word_data and word_data['path']:
-                        if isinstance(word_data['path'][0], list):
-                            word_data['path'] = [tuple(cell) for cell in word_data['path']]
-                    if 'direction' in word_data and isinstance(word_data['direction'], list):
-                        word_data['direction'] = tuple(word_data['direction'])
+                # Convert paths from lists to tuples (JSON stores tuples as lists).
+                # Every entry is saved the same way, so only the first is checked.
+                placed = self.placed_words
+                if placed and placed[0].get('path') and isinstance(placed[0]['path'][0], list):
+                    for word_data in placed:
+                        word_data['path'] = list(map(tuple, word_data['path']))
+                        if 'direction' in word_data:
+                            word_data['direction'] = tuple(word_data['direction'])
                 
                 self.grid_size = puzzle_data['grid_size']
+                self._discard_puzzle_worker()
 
                 # Reset solver state
                 self.unfound_words = set(self.words)
                 self.found_words = set()
                 self.found_paths = set()
+                self.found_cells = set()
                 self.hint_paths = set()
 
                 # Update UI
                 self.size_spin.setValue(self.grid_size)
-                self.words_text.setPlainText('\n'.join(sorted(self.words)))
-                self.puzzle_grid.set_grid(self.grid)
-                self.update_words_list()
+                self.set_words_text(self._sorted_words)
+                self.refresh_puzzle_display()
 
                 QMessageBox.information(self, "Success", "Puzzle loaded successfully!")
                 self.status_bar.showMessage(f"✓ Puzzle loaded from {filename}")
@@ -1082,19 +1146,21 @@ class WordSearchApp(QMainWindow):
         )
 
         if reply == QMessageBox.Yes:
+            self._discard_puzzle_worker()
             self.words_text.clear()
             self.topic_input.clear()
             self.theme_combo.setCurrentIndex(0)
             self.grid = None
-            self.words = set()
+            self.grid_lines = {}
+            self._set_words(())
             self.placed_words = []
             self.unfound_words = set()
             self.found_words = set()
             self.found_paths = set()
+            self.found_cells = set()
             self.hint_paths = set()
             self.selected_word = None
-            self.puzzle_grid.set_grid(None)
-            self.update_words_list()
+            self.refresh_puzzle_display()
             self.status_bar.showMessage("🧹 All cleared")
             self.unsaved_changes = False
 
@@ -1110,7 +1176,6 @@ class WordSearchApp(QMainWindow):
             return
 
         # Create exported/ folder if it doesn't exist
-        import os
         exported_dir = os.path.join(os.path.dirname(__file__), 'exported')
         os.makedirs(exported_dir, exist_ok=True)
 
@@ -1140,7 +1205,6 @@ class WordSearchApp(QMainWindow):
             return
 
         # Create exported/ folder if it doesn't exist
-        import os
         exported_dir = os.path.join(os.path.dirname(__file__), 'exported')
         os.makedirs(exported_dir, exist_ok=True)
 
@@ -1194,6 +1258,8 @@ class WordSearchApp(QMainWindow):
                 event.ignore()
                 return
 
+        # Don't lose a preference change that is still waiting to be written
+        self._flush_config()
         event.accept()
 
 
@@ -4,7 +4,27 @@ Handles word placement, grid generation, and validation.
 """
 
 import random
-from constants import DIRECTIONS, MAX_PLACEMENT_ATTEMPTS
+from constants import DIRECTIONS
+
+EMPTY = ord(' ')  # Byte value of an unfilled cell
+
+
+class Grid:
+    """
+    Square letter grid used while generating a puzzle, stored as one flat
+    bytearray (index row * size + col) of ASCII letters.
+    """
+    __slots__ = ('size', 'cells')
+
+    def __init__(self, size):
+        self.size = size
+        self.cells = bytearray(b' ') * (size * size)
+
+    def to_lists(self):
+        """Returns the grid as a 2D list of single-letter strings."""
+        text = self.cells.decode('ascii')
+        size = self.size
+        return [list(text[i:i + size]) for i in range(0, size * size, size)]
 
 
 def generate_word_search(grid_size, words):
@@ -17,7 +37,7 @@ def generate_word_search(grid_size, words):
         
     Returns:
         tuple: (grid, placed_words) where grid is a 2D list and placed_words is a list of dicts
-               Returns (None, None) if placement fails after max attempts
+               Returns (None, None) if a word cannot be placed anywhere
     """
     # Filter out words that are too long to fit in the grid
     valid_words = [w for w in words if len(w) <= grid_size]
@@ -26,44 +46,83 @@ def generate_word_search(grid_size, words):
     if len(valid_words) < len(words):
         return None, None
     
+    # More letters than cells would need the words to overlap almost
+    # everywhere; fail fast instead of searching placements for it
+    if sum(map(len, valid_words)) > grid_size * grid_size:
+        return None, None
+    
     # Initialize empty grid filled with spaces
-    grid = [[' ' for _ in range(grid_size)] for _ in range(grid_size)]
+    grid = Grid(grid_size)
     placed_words = []
     
     # Sort words by length (longest first) for better placement success
     sorted_words = sorted(valid_words, key=len, reverse=True)
     
     for word in sorted_words:
-        placed = False
-        attempts = 0
-        
-        while not placed and attempts < MAX_PLACEMENT_ATTEMPTS:
-            # Choose random starting position and direction
-            start_row = random.randint(0, grid_size - 1)
-            start_col = random.randint(0, grid_size - 1)
-            direction = random.choice(DIRECTIONS)
-            
-            # Check if word fits in this position/direction
+        # Try every in-bounds start/direction once, in random order, rather
+        # than drawing random positions that may not even fit on the grid
+        for start_row, start_col, direction in _candidate_placements(grid_size, len(word)):
             if can_place_word(grid, word, start_row, start_col, direction):
-                # Place the word
                 place_word(grid, word, start_row, start_col, direction)
                 placed_words.append({
                     'word': word,
                     'path': get_word_path(word, start_row, start_col, direction),
                     'direction': direction
                 })
-                placed = True
-            
-            attempts += 1
-        
-        if not placed:
-            # Failed to place this word
+                break
+        else:
+            # No position left for this word
             return None, None
     
     # Fill empty cells with random letters
     fill_empty_cells(grid)
     
-    return grid, placed_words
+    return grid.to_lists(), placed_words
+
+
+def _start_range(step, length, grid_size):
+    """Returns the start indices along one axis where a word of the given length fits."""
+    if step > 0:
+        return range(grid_size - length + 1)
+    if step < 0:
+        return range(length - 1, grid_size)
+    return range(grid_size)
+
+
+def _candidate_placements(grid_size, length):
+    """
+    Yields every (row, col, direction) where a word of the given length fits
+    inside the grid bounds, in random order.
+    """
+    # Each direction's valid starts form a rectangle; number them all and
+    # shuffle the numbers, decoding only the candidates actually tried
+    blocks = []
+    for direction in DIRECTIONS:
+        rows = _start_range(direction[0], length, grid_size)
+        cols = _start_range(direction[1], length, grid_size)
+        blocks.append((len(rows) * len(cols), rows, cols, direction))
+    total = sum(block[0] for block in blocks)
+
+    for index in _shuffled(range(total)):
+        for count, rows, cols, direction in blocks:
+            if index < count:
+                row, col = divmod(index, len(cols))
+                yield rows[row], cols[col], direction
+                break
+            index -= count
+
+
+def _shuffled(items):
+    """
+    Yields items in random order without copying them. This is a lazy
+    Fisher-Yates shuffle that records swapped positions in a dict, so stopping
+    early only costs as many steps as items taken.
+    """
+    moved = {}
+    for i in range(len(items) - 1, -1, -1):
+        j = random.randint(0, i)
+        yield items[moved.get(j, j)]
+        moved[j] = moved.get(i, i)
 
 
 def can_place_word(grid, word, start_row, start_col, direction):
@@ -71,8 +130,8 @@ def can_place_word(grid, word, start_row, start_col, direction):
     Checks if a word can be placed at the given position in the given direction.
     
     Args:
-        grid: 2D list representing the grid
-        word (str): Word to place
+        grid (Grid): The grid being filled
+        word (str): Word to place (ASCII letters)
         start_row, start_col: Starting position
         direction: Tuple (dr, dc) for direction
         
@@ -80,19 +139,27 @@ def can_place_word(grid, word, start_row, start_col, direction):
         bool: True if placement is possible
     """
     dr, dc = direction
-    size = len(grid)
+    size = grid.size
     
-    for i, letter in enumerate(word):
-        row = start_row + i * dr
-        col = start_col + i * dc
-        
-        # Check bounds
-        if not (0 <= row < size and 0 <= col < size):
-            return False
-        
+    # Check bounds once: the path is straight, so if both ends are on
+    # the grid every cell in between is too
+    last = len(word) - 1
+    end_row = start_row + last * dr
+    end_col = start_col + last * dc
+    if not (0 <= start_row < size and 0 <= start_col < size
+            and 0 <= end_row < size and 0 <= end_col < size):
+        return False
+    
+    # Step along the flat cell array; one move along the line is a fixed offset
+    cells = grid.cells
+    index = start_row * size + start_col
+    step = dr * size + dc
+    for letter in word.encode('ascii'):
         # Check if cell is empty or contains the same letter
-        if grid[row][col] != ' ' and grid[row][col] != letter:
+        cell = cells[index]
+        if cell != EMPTY and cell != letter:
             return False
+        index += step
     
     return True
 
@@ -102,17 +169,20 @@ def place_word(grid, word, start_row, start_col, direction):
     Places a word on the grid at the given position in the given direction.
     
     Args:
-        grid: 2D list representing the grid
-        word (str): Word to place
+        grid (Grid): The grid being filled
+        word (str): Word to place (ASCII letters)
         start_row, start_col: Starting position
         direction: Tuple (dr, dc) for direction
     """
     dr, dc = direction
+    size = grid.size
     
-    for i, letter in enumerate(word):
-        row = start_row + i * dr
-        col = start_col + i * dc
-        grid[row][col] = letter
+    cells = grid.cells
+    index = start_row * size + start_col
+    step = dr * size + dc
+    for letter in word.encode('ascii'):
+        cells[index] = letter
+        index += step
 
 
 def get_word_path(word, start_row, start_col, direction):
@@ -142,10 +212,84 @@ def fill_empty_cells(grid):
     """
     Fills all empty cells (' ') in the grid with random uppercase letters.
     
+    Args:
+        grid (Grid): The grid being filled
+    """
+    cells = grid.cells
+    empty = [index for index, cell in enumerate(cells) if cell == EMPTY]
+
+    # Draw all the filler letters in one call instead of one per cell
+    letters = random.choices(b'ABCDEFGHIJKLMNOPQRSTUVWXYZ', k=len(empty))
+    for index, letter in zip(empty, letters):
+        cells[index] = letter
+
+
+def index_grid_lines(grid):
+    """
+    Joins every row, column and diagonal of a filled grid into a string.
+    
     Args:
         grid: 2D list representing the grid
+        
+    Returns:
+        dict: Maps each forward direction (0, 1), (1, 0), (1, 1) and (1, -1) to
+              a dict of {line key: line string}. Rows are keyed by row, columns by
+              column, diagonals by row - col and anti-diagonals by row + col.
     """
-    for row in range(len(grid)):
-        for col in range(len(grid[row])):
-            if grid[row][col] == ' ':
-                grid[row][col] = random.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+    size = len(grid)
+    rows = {r: ''.join(grid[r]) for r in range(size)}
+    cols = {c: ''.join([grid[r][c] for r in range(size)]) for c in range(size)}
+    diagonals = {}
+    anti_diagonals = {}
+    for k in range(-(size - 1), size):
+        start = max(0, k)
+        diagonals[k] = ''.join([grid[r][r - k] for r in range(start, min(size, size + k))])
+    for k in range(2 * size - 1):
+        start = max(0, k - (size - 1))
+        anti_diagonals[k] = ''.join([grid[r][k - r] for r in range(start, min(size, k + 1))])
+    return {(0, 1): rows, (1, 0): cols, (1, 1): diagonals, (1, -1): anti_diagonals}
+
+
+def read_path_word(lines, path):
+    """
+    Reads the letters along a straight path by slicing a line from index_grid_lines.
+    
+    Args:
+        lines: Result of index_grid_lines for the grid
+        path: List of (row, col) tuples in a straight line
+        
+    Returns:
+        str: The letters along the path, or None if the path is not a straight
+             run of adjacent cells (callers should fall back to reading cells)
+    """
+    length = len(path)
+    if length < 2:
+        return None
+    (r1, c1), (r2, c2) = path[0], path[-1]
+    dr, dc = r2 - r1, c2 - c1
+    steps = length - 1
+    if abs(dr) not in (0, steps) or abs(dc) not in (0, steps):
+        return None
+    dr = (dr > 0) - (dr < 0)
+    dc = (dc > 0) - (dc < 0)
+
+    # Lines run top-to-bottom (left-to-right for rows); read backwards
+    # paths from their far end and reverse the slice
+    backwards = dr < 0 or (dr == 0 and dc < 0)
+    if backwards:
+        dr, dc = -dr, -dc
+        r1, c1 = r2, c2
+
+    if (dr, dc) == (0, 1):
+        line, offset = lines[(0, 1)][r1], c1
+    elif (dr, dc) == (1, 0):
+        line, offset = lines[(1, 0)][c1], r1
+    elif (dr, dc) == (1, 1):
+        k = r1 - c1
+        line, offset = lines[(1, 1)][k], r1 - max(0, k)
+    else:
+        k = r1 + c1
+        line, offset = lines[(1, -1)][k], r1 - max(0, k - (len(lines[(0, 1)]) - 1))
+
+    word = line[offset:offset + length]
+    return word[::-1] if backwards else word
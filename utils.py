@@ -5,6 +5,7 @@ Includes API handling, file I/O, validation, and theme management.
 
 import json
 import os
+import re
 from PySide6.QtCore import QThread, Signal
 from PySide6.QtWidgets import QMessageBox
 
@@ -12,6 +13,7 @@ from constants import (
     CONFIG_FILE, THEMES_FILE, DEFAULT_THEMES_DATA,
     MIN_WORD_LEN, MAX_WORD_LEN, MAX_WORDS_COUNT, API_TIMEOUT
 )
+from puzzle_engine import generate_word_search
 
 # Google Generative AI (optional)
 try:
@@ -19,6 +21,83 @@ try:
 except ImportError:
     genai = None
 
+# orjson (optional, faster JSON encoding)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# First Gemini model that answered the probe, per API key
+_MODEL_CACHE = {}
+
+# Parsed JSON files keyed by path: (mtime_ns, data)
+_JSON_CACHE = {}
+
+
+# --- JSON FILE CACHE ---
+
+def _read_json_cached(path):
+    """
+    Returns the parsed contents of a JSON file, re-reading it only when its
+    modification time changes. The result is shared; callers must not mutate it.
+    Raises FileNotFoundError or json.JSONDecodeError like json.load would.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(path, 'rb') as f:
+        data = json.load(f)
+    _JSON_CACHE[path] = (mtime, data)
+    return data
+
+
+def _write_json_cached(path, data):
+    """Writes data to a JSON file compactly and primes the cache with it."""
+    write_json(path, data)
+    _JSON_CACHE[path] = (os.stat(path).st_mtime_ns, data)
+
+
+def write_json(path, data, indent=False):
+    """
+    Writes data to a JSON file (UTF-8), using orjson when it is installed.
+    Files the app only reads back itself are written compactly; pass
+    indent=True for files meant to be opened by people.
+    """
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0))
+    elif indent:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=4)
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+
+# --- CONFIG FILE ---
+
+def load_config():
+    """
+    Returns the parsed contents of config.json, or an empty dict if it is
+    missing or unreadable. The result is shared; callers must not mutate it.
+    """
+    try:
+        return _read_json_cached(CONFIG_FILE)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def update_config(changes):
+    """
+    Merges the given settings into config.json, keeping everything else
+    already in the file. Every config writer goes through here so none of
+    them overwrites another's settings. Raises OSError if writing fails.
+    """
+    config = dict(load_config())
+    config.update(changes)
+    _write_json_cached(CONFIG_FILE, config)
+
 
 # --- API KEY MANAGEMENT ---
 
@@ -30,26 +109,13 @@ def get_gemini_key():
         return key
 
     # 2. Check config file
-    try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
-            return config.get('GEMINI_API_KEY')
-    except (FileNotFoundError, json.JSONDecodeError):
-        return None
+    return load_config().get('GEMINI_API_KEY')
 
 
 def save_gemini_key(key):
     """Saves Gemini API key to config.json."""
     try:
-        config = {}
-        if os.path.exists(CONFIG_FILE):
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-
-        config['GEMINI_API_KEY'] = key
-
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=4)
+        update_config({'GEMINI_API_KEY': key})
         return True
     except Exception as e:
         QMessageBox.critical(None, "Save Error", f"Could not save API key to {CONFIG_FILE}: {e}")
@@ -62,9 +128,7 @@ def load_themes():
     """Loads custom themes from themes.json, merging with defaults."""
     themes = DEFAULT_THEMES_DATA.copy()
     try:
-        with open(THEMES_FILE, 'r') as f:
-            custom_themes = json.load(f)
-            themes.update(custom_themes)
+        themes.update(_read_json_cached(THEMES_FILE))
     except (FileNotFoundError, json.JSONDecodeError):
         # File doesn't exist or is empty/corrupt, use defaults
         pass
@@ -76,8 +140,7 @@ def save_themes(themes):
     # Only save custom themes (i.e., not in DEFAULT_THEMES_DATA)
     custom_themes = {k: v for k, v in themes.items() if k not in DEFAULT_THEMES_DATA}
     try:
-        with open(THEMES_FILE, 'w') as f:
-            json.dump(custom_themes, f, indent=4)
+        _write_json_cached(THEMES_FILE, custom_themes)
         return True
     except Exception as e:
         QMessageBox.critical(None, "Save Error", f"Could not save themes to {THEMES_FILE}: {e}")
@@ -86,20 +149,22 @@ def save_themes(themes):
 
 # --- WORD VALIDATION ---
 
+_WORD_RE = re.compile(f'[A-Z]{{{MIN_WORD_LEN},{MAX_WORD_LEN}}}')
+
+
 def validate_words(words_list):
     """Validates and filters a list of words according to constraints."""
     validated = []
+    seen = set()
     for word in words_list:
         word = word.strip().upper()
-        # Check length constraints
-        if not (MIN_WORD_LEN <= len(word) <= MAX_WORD_LEN):
-            continue
-        # Check for only uppercase letters
-        if not word.isalpha() or not word.isupper():
+        # Check length constraints and that it is only letters A-Z, in one match
+        if not _WORD_RE.fullmatch(word):
             continue
-        # Check for duplicates (case-insensitive)
-        if word in [w.upper() for w in validated]:
+        # Check for duplicates (words are already uppercased, so this is case-insensitive)
+        if word in seen:
             continue
+        seen.add(word)
         validated.append(word)
 
     return validated[:MAX_WORDS_COUNT]  # Limit to max words
@@ -118,24 +183,7 @@ def fetch_topic_words(api_key, topic, num_words):
     # Configure the API with the loaded key
     genai.configure(api_key=api_key)
 
-    # Try different model names in order of preference
-    model_names = ['gemini-1.5-flash', 'gemini-1.5-pro', 'gemini-2.0-flash-exp']
-    model = None
-
-    for model_name in model_names:
-        try:
-            model = genai.GenerativeModel(model_name)
-            # Test the model with a simple request
-            test_response = model.generate_content(
-                "Test", 
-                generation_config=genai.types.GenerationConfig(max_output_tokens=1)
-            )
-            break  # If we get here, the model works
-        except Exception:
-            continue  # Try next model
-
-    if model is None:
-        raise ValueError("No available Gemini models found. Please check your API key and library version.")
+    model = _get_gemini_model(api_key)
 
     prompt = (
         f"List exactly {num_words} unique uppercase English words "
@@ -162,7 +210,51 @@ def fetch_topic_words(api_key, topic, num_words):
     return validated_words
 
 
-# --- WORKER THREAD FOR API CALLS ---
+def _get_gemini_model(api_key):
+    """
+    Returns the first Gemini model that works with this API key.
+    The lookup only runs the first time a key is used.
+    """
+    model = _MODEL_CACHE.get(api_key)
+    if model is not None:
+        return model
+
+    # Try different model names in order of preference
+    model_names = ['gemini-1.5-flash', 'gemini-1.5-pro', 'gemini-2.0-flash-exp']
+
+    # One list_models call tells us which models this key can generate with
+    try:
+        supported = {
+            m.name for m in genai.list_models()
+            if 'generateContent' in m.supported_generation_methods
+        }
+    except Exception:
+        supported = None
+
+    if supported is not None:
+        for model_name in model_names:
+            if f"models/{model_name}" in supported:
+                model = genai.GenerativeModel(model_name)
+                _MODEL_CACHE[api_key] = model
+                return model
+    else:
+        # Listing isn't available; fall back to a test request per model
+        for model_name in model_names:
+            try:
+                model = genai.GenerativeModel(model_name)
+                model.generate_content(
+                    "Test", 
+                    generation_config=genai.types.GenerationConfig(max_output_tokens=1)
+                )
+            except Exception:
+                continue  # Try next model
+            _MODEL_CACHE[api_key] = model
+            return model
+
+    raise ValueError("No available Gemini models found. Please check your API key and library version.")
+
+
+# --- WORKER THREADS ---
 
 class ApiWorker(QThread):
     """Worker thread for API calls to prevent UI blocking."""
@@ -181,3 +273,21 @@ class ApiWorker(QThread):
             self.finished.emit(words, self.topic)
         except Exception as e:
             self.error.emit(str(e))
+
+
+class PuzzleWorker(QThread):
+    """Worker thread for puzzle generation to prevent UI blocking."""
+    finished = Signal(object, object, list)  # grid, placed_words, words (grid is None on failure)
+    error = Signal(str)  # error message
+
+    def __init__(self, grid_size, words, parent=None):
+        super().__init__(parent)
+        self.grid_size = grid_size
+        self.words = words
+
+    def run(self):
+        try:
+            grid, placed_words = generate_word_search(self.grid_size, self.words)
+            self.finished.emit(grid, placed_words, self.words)
+        except Exception as e:
+            self.error.emit(str(e))
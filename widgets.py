@@ -2,11 +2,128 @@
 Custom widgets for Word Search Creator application.
 """
 
-from PySide6.QtWidgets import QGraphicsView, QGraphicsScene, QGraphicsRectItem
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QColor, QPen, QBrush
+from PySide6.QtWidgets import (
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsLineItem, QStyledItemDelegate
+)
+from PySide6.QtCore import Qt, Signal, QPoint, QPointF, QRectF, QLineF
+from PySide6.QtGui import QColor, QPen, QBrush, QPalette, QFont, QFontMetricsF
+
+from constants import (
+    CELL_SIZE, DEFAULT_BG_COLOR, DEFAULT_FG_COLOR, HINT_COLOR, FOUND_COLOR, TEMP_DRAG_COLOR,
+    SUCCESS_COLOR
+)
+
+
+class GridItem(QGraphicsItem):
+    """
+    Scene item that paints the whole letter grid of a PuzzleGrid.
+
+    Cells are drawn straight from the view's grid, masks, brushes and font,
+    and only those intersecting the exposed area are painted.
+    """
+
+    def __init__(self, view):
+        super().__init__()
+        self._view = view
+        self._rect = QRectF()
+        self._text_lefts = {}  # letter -> x offset that centers it in a cell
+        # Needed for option.exposedRect in paint()
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption)
+        # The grid never moves, so Qt can keep it as a pixmap and repaint
+        # only the cells passed to update()
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    def set_extent(self, width):
+        """Resize the item to a width x width grid, repainting all of it."""
+        # Leave room for the outer grid lines, which straddle the edge
+        rect = QRectF(0, 0, width, width).adjusted(-1, -1, 1, 1)
+        if rect != self._rect:
+            self.prepareGeometryChange()
+            self._rect = rect
+        self.update()
+
+    def update_cells(self, indices):
+        """Schedule a repaint of the given cells (flat indices)."""
+        view = self._view
+        size = view.grid_size
+        cell_size = view.cell_size
+        for index in indices:
+            r, c = divmod(index, size)
+            self.update(c * cell_size, r * cell_size, cell_size, cell_size)
+
+    def boundingRect(self):
+        return self._rect
+
+    def paint(self, painter, option, widget=None):
+        view = self._view
+        grid = view.grid
+        if not grid:
+            return
+
+        # Range of cells touching the exposed area
+        size = view.grid_size
+        cell_size = view.cell_size
+        exposed = option.exposedRect
+        c0 = max(0, int(exposed.left() // cell_size))
+        c1 = min(size, int(exposed.right() // cell_size) + 1)
+        r0 = max(0, int(exposed.top() // cell_size))
+        r1 = min(size, int(exposed.bottom() // cell_size) + 1)
+        if c0 >= c1 or r0 >= r1:
+            return
 
-from constants import CELL_SIZE, DEFAULT_BG_COLOR, DEFAULT_FG_COLOR, HINT_COLOR, FOUND_COLOR, TEMP_DRAG_COLOR
+        # Background for the whole block, then highlighted cells on top -
+        # hint highlighting overrides found highlighting
+        painter.fillRect(QRectF(c0 * cell_size, r0 * cell_size,
+                                (c1 - c0) * cell_size, (r1 - r0) * cell_size), view._bg_brush)
+        # Nothing is highlighted until a word is found or hinted, so skip the scan
+        if view.found_paths or view.hint_paths:
+            found_mask = view._found_mask
+            hint_mask = view._hint_mask
+            hint_rects = []
+            found_rects = []
+            for r in range(r0, r1):
+                base = r * size
+                y = r * cell_size
+                for c in range(c0, c1):
+                    index = base + c
+                    if hint_mask[index]:
+                        hint_rects.append(QRectF(c * cell_size, y, cell_size, cell_size))
+                    elif found_mask[index]:
+                        found_rects.append(QRectF(c * cell_size, y, cell_size, cell_size))
+            # One fill call per highlight kind
+            painter.setPen(Qt.NoPen)
+            if found_rects:
+                painter.setBrush(view._found_brush)
+                painter.drawRects(found_rects)
+            if hint_rects:
+                painter.setBrush(view._hint_brush)
+                painter.drawRects(hint_rects)
+
+        # Cell borders
+        top, bottom = r0 * cell_size, r1 * cell_size
+        left, right = c0 * cell_size, c1 * cell_size
+        lines = [QLineF(c * cell_size, top, c * cell_size, bottom) for c in range(c0, c1 + 1)]
+        lines += [QLineF(left, r * cell_size, right, r * cell_size) for r in range(r0, r1 + 1)]
+        painter.setPen(view._grid_pen)
+        painter.drawLines(lines)
+
+        # Letters, with each capital's ink centered in its cell
+        metrics = view._font_metrics
+        baseline = (cell_size + metrics.capHeight()) / 2
+        text_lefts = self._text_lefts
+        painter.setFont(view._font)
+        painter.setPen(view.fg_color)
+        draw_text = painter.drawText
+        for r in range(r0, r1):
+            row = grid[r]
+            y = r * cell_size + baseline
+            for c in range(c0, c1):
+                letter = row[c]
+                if letter != ' ':
+                    left = text_lefts.get(letter)
+                    if left is None:
+                        left = text_lefts[letter] = (cell_size - metrics.horizontalAdvance(letter)) / 2
+                    draw_text(QPointF(c * cell_size + left, y), letter)
 
 
 class PuzzleGrid(QGraphicsView):
@@ -18,129 +135,225 @@ class PuzzleGrid(QGraphicsView):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.scene = QGraphicsScene(self)
+        # The scene holds only the grid item and the drag overlay, and is
+        # never hit-tested, so skip maintaining a BSP index for it
+        self.scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
         self.setScene(self.scene)
+        # Drags only touch the overlay line; repaint its bounding regions
+        # rather than the whole viewport (full updates measured 4-10x slower)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.SmartViewportUpdate)
+        # Keep the grid centered when the layout resizes the view after a
+        # new grid size changes its minimum size
+        self.setResizeAnchor(QGraphicsView.ViewportAnchor.AnchorViewCenter)
 
         self.grid_size = 15
         self.cell_size = CELL_SIZE
+        self._inv_cell_size = 1.0 / self.cell_size  # Multiplied in instead of dividing per mouse event
         self.grid = None
         self.bg_color = QColor(DEFAULT_BG_COLOR)
         self.fg_color = QColor(DEFAULT_FG_COLOR)
         self.hint_color = QColor("#FFD700")  # Bright gold for hints
         self.found_color = QColor(FOUND_COLOR)
         self.temp_drag_color = QColor(TEMP_DRAG_COLOR)
+        self.grid_line_color = QColor('#ddd')
 
         # Interaction state
         self.is_dragging = False
         self.drag_start_cell = None
         self.drag_current_cell = None
         self.current_temp_path = []
-        self.found_paths = set()  # frozenset of (r,c) tuples
-        self.hint_paths = set()  # frozenset of (r,c) tuples
+        self._last_move_px = QPoint()  # Viewport position of the last move event handled
+        self._scene_offset = None  # (dx, dy) from viewport to scene coordinates, while untransformed
+        self._path_cache = {}  # (start, end) -> path list from get_path_between
+        self._last_grid_size = None  # Size the view was last laid out for (0 without a grid)
+        self.found_paths = set()  # tuples of (r,c) cells, in path order
+        self.hint_paths = set()  # tuples of (r,c) cells, in path order
+        # Flat per-cell masks (index r * grid_size + c) built from the paths above
+        self._found_mask = bytearray()
+        self._hint_mask = bytearray()
+        # One font shared by every letter; its metrics position letters in their cells
+        self._font = QFont()
+        self._font_metrics = QFontMetricsF(self._font)
+
+        # Shared brushes and pen for the cells, rebuilt only when a color changes
+        self._brush_colors = None
+        self._rebuild_brushes()
+
+        # The letter grid itself, painted as a single item
+        self._grid_item = GridItem(self)
+        self.scene.addItem(self._grid_item)
+
+        # Drag path overlay: one persistent line from the first to the last
+        # dragged cell, kept above the cells and only moved during a drag
+        self._temp_line = QGraphicsLineItem()
+        self._temp_line.setZValue(10)
+        self._temp_line.hide()
+        self._temp_line_color = None  # QColor the overlay pen was last built with
+        self.scene.addItem(self._temp_line)
 
         self.setMinimumSize(400, 400)  # Base minimum size
         self.setStyleSheet("border: 1px solid #ccc;")
 
-    def set_grid(self, grid, found_paths=None, hint_paths=None):
-        """Update the displayed grid."""
+    def set_grid(self, grid, found_paths=None, hint_paths=None, found_cells=None):
+        """
+        Update the displayed grid.
+
+        found_cells, if given, is the set of (r,c) cells covered by found_paths;
+        callers that already track it save flattening the paths here.
+        """
+        rebuild = grid is not self.grid
         self.grid = grid
-        self.grid_size = len(grid) if grid else 15
+        grid_size = len(grid) if grid else 15
+        if grid_size != self.grid_size:
+            self._path_cache.clear()
+        self.grid_size = grid_size
         self.found_paths = found_paths or set()
         self.hint_paths = hint_paths or set()
-
-        # Adjust minimum size based on grid size
-        min_size = max(400, self.grid_size * self.cell_size + 100)
-        self.setMinimumSize(min_size, min_size)
-
-        self.redraw()
-
-        # Ensure the view is centered on the grid
-        if self.grid:
-            grid_width = self.grid_size * self.cell_size
-            grid_height = self.grid_size * self.cell_size
-            self.centerOn(grid_width / 2, grid_height / 2)
+        if found_cells is None:
+            found_cells = [cell for path in self.found_paths for cell in path]
+        self._found_mask = self._cell_mask(found_cells)
+        self._hint_mask = self._cell_mask([cell for path in self.hint_paths for cell in path])
+
+        # Sizing and centering only change when the displayed grid size does
+        shown_size = self.grid_size if grid else 0
+        resized = shown_size != self._last_grid_size
+        if resized:
+            # Adjust minimum size based on grid size
+            min_size = max(400, self.grid_size * self.cell_size + 100)
+            self.setMinimumSize(min_size, min_size)
+
+        # A new grid may change the scene layout; otherwise only colors may have changed
+        if rebuild:
+            self._full_rebuild(resized)
+        else:
+            self.redraw()
+        self._last_grid_size = shown_size
+
+    def _cell_mask(self, cells):
+        """Build a bytearray with 1 for every (r,c) cell given."""
+        size = self.grid_size
+        mask = bytearray(size * size)
+        for r, c in cells:
+            mask[r * size + c] = 1
+        return mask
+
+    def _rebuild_brushes(self):
+        """Recreate the shared cell brushes and grid pen if any of their colors changed."""
+        colors = (self.bg_color, self.found_color, self.hint_color, self.grid_line_color)
+        if colors == self._brush_colors:
+            return
+        self._brush_colors = colors
+        self._bg_brush = QBrush(self.bg_color)
+        self._found_brush = QBrush(self.found_color)
+        self._hint_brush = QBrush(self.hint_color)
+        self._grid_pen = QPen(self.grid_line_color, 1)
+        self._grid_pen.setCosmetic(True)
 
     def redraw(self):
-        """Redraw the entire grid."""
-        self.scene.clear()
+        """Repaint the grid with the current colors and highlights."""
+        self._rebuild_brushes()
+        self._grid_item.update()
+        self._update_temp_path()
 
-        if not self.grid:
-            return
+    def _full_rebuild(self, resized=True):
+        """Fit the scene and grid item to the current grid, re-centering if it resized."""
+        self._rebuild_brushes()
 
         # Calculate grid dimensions
-        grid_width = self.grid_size * self.cell_size
-        grid_height = self.grid_size * self.cell_size
-
-        # Set scene rectangle to center the grid in the view
-        # The scene will be larger than the grid to allow for centering
-        scene_margin = 50  # Extra space around the grid
-        self.scene.setSceneRect(-scene_margin, -scene_margin,
-                               grid_width + 2 * scene_margin,
-                               grid_height + 2 * scene_margin)
-
-        # Center the view on the grid
-        self.centerOn(grid_width / 2, grid_height / 2)
-
-        # Draw cells
-        for r in range(self.grid_size):
-            for c in range(self.grid_size):
-                x = c * self.cell_size
-                y = r * self.cell_size
-
-                # Determine cell color - check if this cell is part of any found or hint path
-                bg_color = self.bg_color
-                
-                # Check if cell is part of any found word path
-                for path in self.found_paths:
-                    if (r, c) in path:
-                        bg_color = self.found_color
-                        break
-                
-                # Check if cell is part of any hint path (overrides found color)
-                for path in self.hint_paths:
-                    if (r, c) in path:
-                        bg_color = self.hint_color
-                        break
-
-                # Create cell rectangle
-                rect = QGraphicsRectItem(x, y, self.cell_size, self.cell_size)
-                rect.setBrush(QBrush(bg_color))
-                rect.setPen(QPen(QColor('#ddd'), 1))
-                self.scene.addItem(rect)
-
-                # Add letter text
-                if self.grid[r][c] != ' ':
-                    text = self.scene.addText(self.grid[r][c])
-                    text.setPos(x + self.cell_size/2 - 5, y + self.cell_size/2 - 8)
-                    text.setDefaultTextColor(self.fg_color)
+        grid_width = self.grid_size * self.cell_size if self.grid else 0
+        grid_height = grid_width
+        self._grid_item.set_extent(grid_width)
+
+        if self.grid and resized:
+            # Set scene rectangle to center the grid in the view
+            # The scene will be larger than the grid to allow for centering
+            scene_margin = 50  # Extra space around the grid
+            self.scene.setSceneRect(-scene_margin, -scene_margin,
+                                   grid_width + 2 * scene_margin,
+                                   grid_height + 2 * scene_margin)
+
+            # Center the view on the grid
+            self.centerOn(grid_width / 2, grid_height / 2)
 
         # Draw temporary drag path as a line
-        if self.current_temp_path:
-            self.draw_path(self.current_temp_path, self.temp_drag_color, 3)
-
-        # Note: Found words are now shown with highlighted cell backgrounds (no lines)
-        # Hints are shown with highlighted cell backgrounds (no lines)
-
-    def draw_path(self, path, color, width):
-        """Draw a highlighted path on the grid."""
-        if len(path) < 2:
+        self._update_temp_path()
+
+    def _update_temp_path(self):
+        """Move the drag overlay to the current temporary path, or hide it."""
+        path = self.current_temp_path
+        line = self._temp_line
+        if len(path) < 2 or not self.grid:
+            line.hide()
             return
 
-        pen = QPen(color, width)
-        for i in range(len(path) - 1):
-            r1, c1 = path[i]
-            r2, c2 = path[i + 1]
-            x1 = c1 * self.cell_size + self.cell_size / 2
-            y1 = r1 * self.cell_size + self.cell_size / 2
-            x2 = c2 * self.cell_size + self.cell_size / 2
-            y2 = r2 * self.cell_size + self.cell_size / 2
-            line = self.scene.addLine(x1, y1, x2, y2, pen)
+        # Paths are straight, so the two end cell centers describe the whole line
+        if self._temp_line_color is not self.temp_drag_color:
+            line.setPen(QPen(self.temp_drag_color, 3))
+            self._temp_line_color = self.temp_drag_color
+        half = self.cell_size / 2
+        (r1, c1), (r2, c2) = path[0], path[-1]
+        line.setLine(c1 * self.cell_size + half, r1 * self.cell_size + half,
+                     c2 * self.cell_size + half, r2 * self.cell_size + half)
+        line.show()
+
+    def mark_path_found(self, path):
+        """Highlight a newly found path, repainting only cells whose color changes."""
+        self.found_paths.add(tuple(path))
+        size = self.grid_size
+        found_mask = self._found_mask
+        hint_mask = self._hint_mask
+        changed = []
+        for r, c in path:
+            index = r * size + c
+            if not found_mask[index]:
+                found_mask[index] = 1
+                # Hinted cells keep showing the hint color
+                if not hint_mask[index]:
+                    changed.append(index)
+        if changed and self.grid:
+            self._grid_item.update_cells(changed)
+
+    def set_hint_paths(self, hint_paths):
+        """Replace the hint highlights, updating only cells that gain or lose a hint."""
+        size = self.grid_size
+        hint_mask = self._hint_mask
+        old = {r * size + c for path in self.hint_paths for r, c in path}
+        new = {r * size + c for path in hint_paths for r, c in path}
+        for index in old - new:
+            hint_mask[index] = 0
+        for index in new - old:
+            hint_mask[index] = 1
+        self.hint_paths = hint_paths
+        # Cells hinted both before and after look the same
+        changed = old ^ new
+        if changed and self.grid:
+            self._grid_item.update_cells(changed)
 
     def get_cell_from_pos(self, pos):
         """Convert scene position to grid cell coordinates."""
-        x, y = pos.x(), pos.y()
-        c = int(x // self.cell_size)
-        r = int(y // self.cell_size)
-        if 0 <= r < self.grid_size and 0 <= c < self.grid_size:
+        return self._cell_from_xy(pos.x(), pos.y())
+
+    def _cell_at(self, pos):
+        """Grid cell under viewport position pos, or None."""
+        offset = self._scene_offset
+        if offset is None:
+            if not self.transform().isIdentity():
+                return self.get_cell_from_pos(self.mapToScene(pos))
+            # Without zoom or rotation, viewport -> scene is a plain translation
+            origin = self.mapToScene(QPoint(0, 0))
+            offset = self._scene_offset = (origin.x(), origin.y())
+        return self._cell_from_xy(pos.x() + offset[0], pos.y() + offset[1])
+
+    def _cell_from_xy(self, x, y):
+        """Grid cell containing scene point (x, y), or None."""
+        # int() truncates toward zero, so rule out the margin above/left of the grid first
+        if x < 0 or y < 0:
+            return None
+        inv = self._inv_cell_size
+        c = int(x * inv)
+        r = int(y * inv)
+        size = self.grid_size
+        if r < size and c < size:
             return (r, c)
         return None
 
@@ -149,31 +362,60 @@ class PuzzleGrid(QGraphicsView):
             # Emit signal that puzzle was clicked (to clear hints)
             self.puzzle_clicked.emit()
             
-            cell = self.get_cell_from_pos(self.mapToScene(event.pos()))
+            # Re-measure the viewport offset for each drag
+            self._scene_offset = None
+            cell = self._cell_at(event.pos())
             if cell:
                 self.is_dragging = True
                 self.drag_start_cell = cell
                 self.drag_current_cell = cell
                 self.current_temp_path = [cell]
-                self.redraw()
+                self._last_move_px = event.pos()
+                self._update_temp_path()
 
     def mouseMoveEvent(self, event):
         if self.is_dragging and self.grid:
-            cell = self.get_cell_from_pos(self.mapToScene(event.pos()))
-            if cell and cell != self.drag_current_cell:
-                # Check if this forms a valid line with the start
-                if self.is_valid_drag_path(self.drag_start_cell, cell):
-                    self.drag_current_cell = cell
-                    self.current_temp_path = self.get_path_between(self.drag_start_cell, cell)
-                    self.redraw()
+            # Skip moves of under a third of a cell since the last one handled;
+            # the release position is always checked, so no cell is missed
+            pos = event.pos()
+            last = self._last_move_px
+            if abs(pos.x() - last.x()) + abs(pos.y() - last.y()) < self.cell_size // 3:
+                return
+            self._last_move_px = pos
+            self._drag_to(pos)
+
+    def _drag_to(self, pos):
+        """Extend the drag to the cell under viewport position pos if it lines up with the start."""
+        cell = self._cell_at(pos)
+        if cell and cell != self.drag_current_cell:
+            start = self.drag_start_cell
+            # Only straight paths are memoized, so a cached path is already
+            # known to be valid; otherwise check it forms a line with the start
+            path = self._path_cache.get((start, cell))
+            if path is None:
+                if not self.is_valid_drag_path(start, cell):
+                    return
+                path = self.get_path_between(start, cell)
+            self.drag_current_cell = cell
+            self.current_temp_path = path
+            self._update_temp_path()
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.LeftButton and self.is_dragging:
+            self._drag_to(event.pos())
             self.is_dragging = False
             if self.current_temp_path:
                 self.word_selected.emit(self.current_temp_path)
             self.current_temp_path = []
-            self.redraw()
+            self._update_temp_path()
+
+    def scrollContentsBy(self, dx, dy):
+        self._scene_offset = None
+        super().scrollContentsBy(dx, dy)
+
+    def resizeEvent(self, event):
+        self._scene_offset = None
+        super().resizeEvent(event)
 
     def is_valid_drag_path(self, start, end):
         """Check if the drag forms a straight line (horizontal, vertical, or diagonal)."""
@@ -187,26 +429,50 @@ class PuzzleGrid(QGraphicsView):
         return dr == 0 or dc == 0 or abs(dr) == abs(dc)
 
     def get_path_between(self, start, end):
-        """Get all cells in a straight line between start and end."""
+        """
+        Get all cells in a straight line between start and end.
+
+        Straight-line paths are memoized per (start, end) for the current grid
+        size, so callers share the returned list and must not modify it.
+        """
+        key = (start, end)
+        path = self._path_cache.get(key)
+        if path is not None:
+            return path
+
         r1, c1 = start
         r2, c2 = end
 
         dr = r2 - r1
         dc = c2 - c1
 
-        # Normalize direction
+        # Normalize direction to a unit step per axis
         steps = max(abs(dr), abs(dc))
-        if steps == 0:
-            return [start]
-
-        dr_step = dr // steps if dr != 0 else 0
-        dc_step = dc // steps if dc != 0 else 0
+        dr_step = (dr > 0) - (dr < 0)
+        dc_step = (dc > 0) - (dc < 0)
 
+        size = self.grid_size
         path = []
         for i in range(steps + 1):
             r = r1 + dr_step * i
             c = c1 + dc_step * i
-            if 0 <= r < self.grid_size and 0 <= c < self.grid_size:
+            if 0 <= r < size and 0 <= c < size:
                 path.append((r, c))
 
+        if dr == 0 or dc == 0 or abs(dr) == abs(dc):
+            self._path_cache[key] = path
         return path
+
+
+class FoundWordDelegate(QStyledItemDelegate):
+    """Item delegate for the word list that draws found words in the success color."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.found_words = set()
+        self._success_color = QColor(SUCCESS_COLOR)  # Shared by every found item
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if index.data() in self.found_words:
+            option.palette.setColor(QPalette.Text, self._success_color)